@@ -3,6 +3,7 @@
 Setup configuration for PyImportSync package.
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -19,6 +20,21 @@ def get_version():
                 return line.split("=")[1].strip().strip('"').strip("'")
     return "1.0.0"
 
+# Optionally compile the hot string helpers with mypyc; pure Python otherwise.
+# mypyc comes with mypy, which must be installed in the building environment:
+#   pip install mypy && PYIMPORTSYNC_USE_MYPYC=1 pip install --no-build-isolation .
+ext_modules = []
+if os.environ.get("PYIMPORTSYNC_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        raise SystemExit(
+            "PYIMPORTSYNC_USE_MYPYC=1 needs mypy installed in the build "
+            "environment (pip install mypy, then --no-build-isolation)"
+        )
+
+    ext_modules = mypycify(["src/pyimportsync/utils_fast.py"])
+
 setup(
     name="pyimportsync",
     version=get_version(),
@@ -35,6 +51,7 @@ setup(
     },
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -56,6 +73,8 @@ setup(
         "pathspec",
         "pipreqs",
         "colorama",
+        # importlib.metadata, used for import-to-package mappings, is 3.8+
+        'importlib_metadata; python_version < "3.8"',
     ],
     extras_require={
         "dev": [
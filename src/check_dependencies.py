@@ -41,7 +41,20 @@ def main():
     parser.add_argument(
         "--output", default="", help="Output file to save missing dependencies"
     )
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        default=None,
+        help="Only scan these Python files instead of the whole project",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="Python files to scan, like --files; list them after -- when a "
+        "name could be mistaken for an option",
+    )
     args = parser.parse_args()
+    files = (args.files or []) + args.paths or None
 
     # Prepare config overrides
     config_overrides = {}
@@ -51,13 +64,9 @@ def main():
         additional_ignore_dirs = [
             d.strip() for d in args.ignore_dirs.split(",") if d.strip()
         ]
-        # Load default config to get existing ignore dirs
-        from pyimportsync.utils import load_config
+        from pyimportsync.utils import DEFAULT_IGNORE_DIRS
 
-        default_config = load_config(None, None)
-        merged_ignore_dirs = list(
-            set(default_config["ignore_dirs"] + additional_ignore_dirs)
-        )
+        merged_ignore_dirs = list(DEFAULT_IGNORE_DIRS.union(additional_ignore_dirs))
         config_overrides["ignore_dirs"] = merged_ignore_dirs
 
     # Handle gitignore settings
@@ -76,39 +85,27 @@ def main():
         enable_cache=not args.no_cache,
     )
 
-    # Run the check
-    result = checker.check(use_pipreqs=not args.no_pipreqs)
+    # Run the check once; its analysis also feeds the output file and quiet mode
+    result = checker.check(use_pipreqs=not args.no_pipreqs, files=files)
+    missing_deps = checker.last_analysis.get("missing", ())
 
     # Handle output file if specified
     if args.output and result != 0:
         try:
-            # Get the analysis results for output
-            analysis_results = checker.analyze_dependencies(
-                use_pipreqs=not args.no_pipreqs
-            )
-            missing_deps = analysis_results.get("missing", [])
-
-            with open(args.output, "w") as f:
-                for dep in missing_deps:
-                    f.write(f"{dep}\n")
+            with open(args.output, "w", newline="\n") as f:
+                if missing_deps:
+                    f.write("\n".join(missing_deps) + "\n")
 
             if verbose:
                 print(f"Missing dependencies written to {args.output}")
-        except Exception as e:
+        except OSError as e:
             if verbose:
                 print(f"Warning: Could not write to output file {args.output}: {e}")
 
     # Handle quiet mode output for missing dependencies
     if args.quiet and result != 0:
-        try:
-            analysis_results = checker.analyze_dependencies(
-                use_pipreqs=not args.no_pipreqs
-            )
-            missing_deps = analysis_results.get("missing", [])
-            for dep in missing_deps:
-                print(dep)
-        except Exception:
-            pass  # Suppress errors in quiet mode
+        for dep in missing_deps:
+            print(dep)
 
     return result
 
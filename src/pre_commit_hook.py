@@ -4,39 +4,78 @@ Pre-commit hook wrapper for dependency checking.
 This script can be used directly as a pre-commit hook or called from other hooks.
 """
 
+import argparse
 import sys
 import subprocess
 import os
 from pathlib import Path
+from typing import Optional
 
+# Where -X importtime output is written when import profiling is enabled
+IMPORTTIME_FILE = "dep-check.importtime"
+
+
+def find_git_root(start: Optional[Path] = None) -> Optional[Path]:
+    """Find the enclosing git work tree by walking up to a ``.git`` entry.
+
+    ``.git`` may be a directory or, for worktrees and submodules, a file;
+    either marks the root. Avoids spawning ``git rev-parse`` on every commit.
+    """
+    start = (start or Path.cwd()).resolve()
+    for directory in (start, *start.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
+def get_staged_python_files(git_root: str):
+    """Get staged (added, copied or modified) Python files in the index.
+
+    Uses ``-z`` so paths with spaces or non-ASCII characters come back
+    verbatim instead of C-quoted.
+    """
+    result = subprocess.run(
+        ["git", "diff", "--cached", "--name-only", "-z", "--diff-filter=ACM"],
+        capture_output=True,
+        # Undecodable bytes round-trip back to the same path when passed on
+        encoding="utf-8",
+        errors="surrogateescape",
+        check=True,
+        cwd=git_root,
+    )
+    return [path for path in result.stdout.split("\0") if path.endswith(".py")]
+
+
+def run_dependency_check(staged_only: bool = False, profile_imports: bool = False):
+    """Run the dependency checker with appropriate arguments for pre-commit.
+
+    With ``profile_imports`` (or ``PYIMPORTSYNC_PROFILE`` set in the
+    environment) the checker runs with ``PYTHONPROFILEIMPORTTIME=1`` and its
+    import timings are saved to ``dep-check.importtime`` for e.g. ``tuna``.
+    """
+    profile_imports = profile_imports or bool(os.environ.get("PYIMPORTSYNC_PROFILE"))
 
-def run_dependency_check():
-    """Run the dependency checker with appropriate arguments for pre-commit."""
     # Get the directory where this script is located
     script_dir = Path(__file__).parent.absolute()
     checker_script = script_dir / "check_dependencies.py"
 
-    # Check if we're in a git repository
-    try:
-        subprocess.run(
-            ["git", "rev-parse", "--git-dir"], capture_output=True, check=True
-        )
-    except subprocess.CalledProcessError:
+    # Find the git root directory
+    git_root_path = find_git_root()
+    if git_root_path is None:
         print("Error: Not in a git repository")
         return 1
+    git_root = str(git_root_path)
 
-    # Get the git root directory
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        git_root = result.stdout.strip()
-    except subprocess.CalledProcessError:
-        print("Error: Could not determine git root directory")
-        return 1
+    # Restrict the scan to staged files, skipping entirely if there are none
+    staged_files = None
+    if staged_only:
+        try:
+            staged_files = get_staged_python_files(git_root)
+        except subprocess.CalledProcessError:
+            print("Error: Could not list staged files")
+            return 1
+        if not staged_files:
+            return 0
 
     # Run the dependency checker
     try:
@@ -48,15 +87,32 @@ def run_dependency_check():
             "--quiet",  # Only show missing dependencies
             "--respect-gitignore",
         ]
+        if staged_files:
+            # After "--" a file named like an option is still a path
+            cmd += ["--", *staged_files]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        env = None
+        if profile_imports:
+            env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1")
+
+        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
 
         if result.stdout:
             print("Missing dependencies found:")
             print(result.stdout)
 
-        if result.stderr:
-            print("Error:", result.stderr, file=sys.stderr)
+        stderr = result.stderr
+        if profile_imports:
+            # Split the import-time trace from any real error output
+            trace, other = [], []
+            for line in stderr.splitlines(keepends=True):
+                (trace if line.startswith("import time:") else other).append(line)
+            stderr = "".join(other)
+            Path(IMPORTTIME_FILE).write_text("".join(trace), encoding="utf-8")
+            print(f"Import timings written to {IMPORTTIME_FILE}", file=sys.stderr)
+
+        if stderr:
+            print("Error:", stderr, file=sys.stderr)
 
         return result.returncode
 
@@ -65,5 +121,28 @@ def run_dependency_check():
         return 1
 
 
+def main():
+    """Parse hook arguments and run the dependency check."""
+    parser = argparse.ArgumentParser(
+        description="PyImportSync pre-commit dependency check"
+    )
+    parser.add_argument(
+        "--staged-only",
+        action="store_true",
+        help="Only scan Python files staged for commit",
+    )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help=f"Record the checker's import times to {IMPORTTIME_FILE}",
+    )
+    # pre-commit passes the matched filenames; the scan scope is decided above
+    parser.add_argument("filenames", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    return run_dependency_check(
+        staged_only=args.staged_only, profile_imports=args.profile_imports
+    )
+
+
 if __name__ == "__main__":
-    sys.exit(run_dependency_check())
+    sys.exit(main())
@@ -8,6 +8,13 @@ in the codebase with requirements.txt and identifies missing or outdated depende
 __version__ = "1.0.0"
 __author__ = "trivedi-vatsal"
 
-from .checker import DependencyChecker
+__all__ = ["DependencyChecker"]
 
-__all__ = ["DependencyChecker"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the checker (and its submodules) only when first requested
+    if name == "DependencyChecker":
+        from .checker import DependencyChecker
+
+        return DependencyChecker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,24 @@ This module handles dependency analysis, package matching, and pipreqs integrati
 to identify missing or outdated dependencies.
 """
 
+import functools
 import re
-import subprocess
+import sys
 from pathlib import Path
-from typing import Set, Dict, List, Tuple
+from typing import Any, Set, Dict, List, Optional, Tuple
 
-from .utils import get_known_import_mappings, normalize_package_name
+from .utils import (
+    get_dynamic_stdlib_modules,
+    get_known_import_mappings,
+    normalize_many,
+    normalize_package_name,
+)
+
+# Leading distribution name of a requirements.txt line (before any specifier)
+_REQUIREMENT_NAME_RE = re.compile(r"^([A-Za-z0-9_.-]+)")
+
+# Standard library modules never map to a distribution
+_STDLIB_MODULES = get_dynamic_stdlib_modules()
 
 
 class DependencyAnalyzer:
@@ -21,11 +33,34 @@ class DependencyAnalyzer:
         self.project_root = project_root
         self.requirements_file = requirements_file
         self.known_mappings = get_known_import_mappings()
-        self.package_metadata_mappings = self._get_package_metadata_mappings()
+        self._package_metadata_mappings: Optional[Dict[str, str]] = None
+        self._requirements_packages: Optional[Set[str]] = None
+        self._requirements_stamp: Optional[Tuple[int, int]] = None
+
+    @property
+    def requirements_packages(self) -> Set[str]:
+        """Requirements package names, re-parsed only when the file changes."""
+        try:
+            stat_result = (self.project_root / self.requirements_file).stat()
+            stamp = (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            stamp = None
+
+        if self._requirements_packages is None or stamp != self._requirements_stamp:
+            self._requirements_packages = self.get_requirements_packages()
+            self._requirements_stamp = stamp
+        return self._requirements_packages
+
+    @property
+    def package_metadata_mappings(self) -> Dict[str, str]:
+        """Installed package mappings, loaded on first use."""
+        if self._package_metadata_mappings is None:
+            self._package_metadata_mappings = self._get_package_metadata_mappings()
+        return self._package_metadata_mappings
 
     def get_requirements_packages(self) -> Set[str]:
         """Parse requirements.txt and extract package names."""
-        packages = set()
+        packages: Set[str] = set()
         requirements_path = self.project_root / self.requirements_file
 
         if not requirements_path.exists():
@@ -41,7 +76,7 @@ class DependencyAnalyzer:
                         continue
 
                     # Extract package name (handle version specifiers)
-                    match = re.match(r"^([a-zA-Z0-9_.-]+)", line)
+                    match = _REQUIREMENT_NAME_RE.match(line)
                     if match:
                         packages.add(match.group(1))
 
@@ -50,11 +85,17 @@ class DependencyAnalyzer:
 
         return packages
 
-    def run_pipreqs(self, use_pipreqs: bool = True) -> List[str]:
-        """Run pipreqs to detect dependencies."""
+    def run_pipreqs(self, use_pipreqs: bool = False) -> List[str]:
+        """Run pipreqs to detect dependencies.
+
+        Imports are already discovered by the AST-based scanner, so spawning
+        pipreqs is opt-in and only used for its supplementary report section.
+        """
         if not use_pipreqs:
             return []
 
+        import subprocess
+
         try:
             # Run pipreqs on the project directory
             result = subprocess.run(
@@ -80,41 +121,60 @@ class DependencyAnalyzer:
             return []
 
     def analyze_dependencies(
-        self, imports: Set[str], use_pipreqs: bool = True
-    ) -> Dict[str, List[str]]:
-        """Analyze dependencies and return missing/matched packages."""
-        requirements_packages = self.get_requirements_packages()
+        self, imports: Set[str], use_pipreqs: bool = False
+    ) -> Dict[str, Any]:
+        """Analyze dependencies and return missing/matched packages.
+
+        ``missing`` is a sorted list of package names and ``matched_pairs`` a
+        sorted list of ``(import_name, package_name)`` tuples.
+        """
+        requirements_packages = self.requirements_packages
+
+        # Nothing to match (no sources, or all excluded); skip pipreqs too
+        if not imports:
+            return {
+                "missing": [],
+                "matched_pairs": [],
+                "pipreqs": [],
+                "requirements_count": len(requirements_packages),
+                "imports_count": 0,
+                "metadata_mappings_count": len(self._package_metadata_mappings or {}),
+            }
+
         pipreqs_packages = self.run_pipreqs(use_pipreqs)
 
-        # Enhanced package matching
-        matched_packages = []
-        missing_packages = []
+        # Normalize requirement names once rather than per import
+        normalized_requirements = set(normalize_many(requirements_packages))
+
+        # Enhanced package matching; display strings are built by the reporter
+        matched_pairs = set()
+        missing_packages = set()
 
         for import_name in imports:
             package_name = self._enhanced_package_matching(import_name)
 
             if package_name:
                 # Check if package is in requirements
-                normalized_requirements = {
-                    normalize_package_name(pkg) for pkg in requirements_packages
-                }
-
                 if normalize_package_name(package_name) in normalized_requirements:
-                    matched_packages.append(f"{import_name} → {package_name}")
+                    matched_pairs.add((import_name, package_name))
                 else:
-                    missing_packages.append(package_name)
+                    missing_packages.add(package_name)
 
         return {
-            "missing": missing_packages,
-            "matched": matched_packages,
+            "missing": sorted(missing_packages),
+            "matched_pairs": sorted(matched_pairs),
             "pipreqs": pipreqs_packages,
             "requirements_count": len(requirements_packages),
             "imports_count": len(imports),
-            "metadata_mappings_count": len(self.package_metadata_mappings),
+            "metadata_mappings_count": len(self._package_metadata_mappings or {}),
         }
 
-    def _enhanced_package_matching(self, import_name: str) -> str:
+    def _enhanced_package_matching(self, import_name: str) -> Optional[str]:
         """Enhanced package name matching using multiple strategies."""
+        # Standard library imports need no package (and no metadata lookup)
+        if import_name in _STDLIB_MODULES:
+            return None
+
         # Strategy 1: Check known mappings first
         if import_name in self.known_mappings:
             return self.known_mappings[import_name]
@@ -128,35 +188,49 @@ class DependencyAnalyzer:
 
     def _get_package_metadata_mappings(self) -> Dict[str, str]:
         """Get package metadata mappings from installed packages."""
-        mappings = {}
+        return _load_package_metadata_mappings(tuple(sys.path))
 
-        try:
-            # Try to get installed packages and their top-level modules
-            import pkg_resources
-
-            for dist in pkg_resources.working_set:
-                package_name = dist.project_name
-
-                # Try to get top-level modules from metadata
-                try:
-                    if dist.has_metadata("top_level.txt"):
-                        top_levels = (
-                            dist.get_metadata("top_level.txt").strip().split("\\n")
-                        )
-                        for top_level in top_levels:
-                            if top_level:
-                                mappings[top_level] = package_name
-                except Exception:
-                    pass
-
-                # Fallback: use package name as potential import name
-                normalized_name = package_name.replace("-", "_").replace(".", "_")
-                mappings[normalized_name] = package_name
 
-        except ImportError:
-            # pkg_resources not available
-            pass
-        except Exception as e:
-            print(f"Warning: Could not load package metadata: {e}")
+@functools.lru_cache(maxsize=None)
+def _load_package_metadata_mappings(search_path: Tuple[str, ...]) -> Dict[str, str]:
+    """Build the import-name to package-name table for installed packages.
 
-        return mappings
+    Cached per ``sys.path`` snapshot so repeated analyzer instances in one
+    process don't walk the installed distributions again.
+    """
+    mappings: Dict[str, str] = {}
+
+    try:
+        from importlib.metadata import distributions
+    except ImportError:
+        try:
+            # Backport for Python < 3.8
+            from importlib_metadata import distributions  # type: ignore
+        except ImportError:
+            return mappings
+
+    try:
+        for dist in distributions(path=list(search_path)):
+            package_name = dist.metadata["Name"]
+            if not package_name:
+                continue
+
+            # Try to get top-level modules from metadata
+            try:
+                top_level_txt = dist.read_text("top_level.txt")
+                if top_level_txt:
+                    for top_level in top_level_txt.splitlines():
+                        top_level = top_level.strip()
+                        if top_level:
+                            mappings[top_level] = package_name
+            except Exception:
+                pass
+
+            # Fallback: use package name as potential import name
+            normalized_name = package_name.replace("-", "_").replace(".", "_")
+            mappings[normalized_name] = package_name
+
+    except Exception as e:
+        print(f"Warning: Could not load package metadata: {e}")
+
+    return mappings
@@ -5,23 +5,40 @@ This module handles file content caching to improve performance when analyzing
 large codebases by avoiding re-parsing unchanged files.
 """
 
-import json
-import hashlib
+import contextlib
+import os
 import time
 from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Set, Optional
 
 
 class FileCache:
     """Manages file content caching for import analysis."""
 
     def __init__(
-        self, cache_file: str = ".pyimportsync_cache.json", enabled: bool = True
+        self,
+        cache_file: str = ".pyimportsync_cache.json",
+        enabled: bool = True,
+        strict: bool = False,
     ):
-        """Initialize cache with specified cache file."""
+        """Initialize cache with specified cache file.
+
+        Entries are validated against the file's (mtime_ns, size). With
+        ``strict=True`` the file's MD5 must also match, at the cost of reading
+        every file on each check.
+
+        Inside a ``journaling()`` block, new entries are also appended to a
+        ``<cache_file>.log`` journal, so an interrupted run keeps its progress;
+        the journal is replayed on the next load and folded into the cache
+        file by ``save_cache``.
+        """
         self.cache_file = Path(cache_file)
+        self.journal_file = self.cache_file.with_name(self.cache_file.name + ".log")
         self.enabled = enabled
+        self.strict = strict
         self.cache_data: Dict[str, Dict] = {}
+        self._journal: Optional[BinaryIO] = None
+        self._journaling = False
         self._load_cache()
 
     def _load_cache(self) -> Dict[str, Dict]:
@@ -30,37 +47,143 @@ class FileCache:
             return {}
 
         if self.cache_file.exists():
+            import json
+
             try:
                 with open(self.cache_file, "r", encoding="utf-8") as f:
                     self.cache_data = json.load(f)
-                return self.cache_data
             except (json.JSONDecodeError, OSError):
                 # If cache is corrupted, start fresh
                 self.cache_data = {}
         else:
             self.cache_data = {}
 
+        self._replay_journal()
         return self.cache_data
 
+    def _replay_journal(self):
+        """Merge entries journaled by a previous run that didn't save."""
+        if not self.journal_file.exists():
+            return
+
+        import json
+
+        try:
+            with open(self.journal_file, "rb") as f:
+                for line in f:
+                    try:
+                        self.cache_data.update(json.loads(line))
+                    except ValueError:
+                        # A run interrupted mid-write leaves a partial last line
+                        continue
+        except OSError:
+            pass
+
+    @contextlib.contextmanager
+    def journaling(self) -> Iterator["FileCache"]:
+        """Journal entries cached inside the block until ``save_cache`` runs.
+
+        Meant for callers that save afterwards: if the block is interrupted,
+        the journal stays on disk and is replayed by the next run. Outside
+        the block nothing is journaled, so callers that never save leave no
+        files behind.
+        """
+        self._journaling = True
+        try:
+            yield self
+        finally:
+            self._journaling = False
+            self.close()
+
+    def close(self):
+        """Close the journal file handle, keeping any entries written so far."""
+        if self._journal is not None:
+            try:
+                self._journal.close()
+            except OSError:
+                pass
+            self._journal = None
+
+    def _append_journal(self, file_key: str, entry: Dict):
+        """Append a single cache entry to the journal file."""
+        if not self._journaling:
+            return
+
+        import json
+
+        try:
+            if self._journal is None:
+                # Unbuffered: each entry reaches the file as one write, so
+                # an interruption loses at most the line being written
+                self._journal = open(self.journal_file, "ab", buffering=0)
+            self._journal.write(
+                json.dumps({file_key: entry}, separators=(",", ":")).encode("utf-8")
+                + b"\n"
+            )
+        except OSError:
+            # The journal is best-effort; save_cache still persists everything
+            pass
+
+    def _discard_journal(self):
+        """Close and remove the journal once its entries are saved."""
+        self.close()
+        try:
+            self.journal_file.unlink()
+        except OSError:
+            pass
+
     def save_cache(self):
         """Save current cache to file."""
         if not self.enabled:
             return
 
+        import json
+        import tempfile
+
+        # Write to a uniquely named sibling temp file and swap it in, so an
+        # interrupted run never leaves a truncated cache behind and
+        # concurrent runs never write into each other's temp file
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache_data, f, indent=2)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_file.parent, prefix=self.cache_file.name + "."
+            )
         except OSError as e:
             print(f"Warning: Could not save cache: {e}")
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.cache_data, f, separators=(",", ":"))
+            os.replace(tmp_name, self.cache_file)
+        except OSError as e:
+            print(f"Warning: Could not save cache: {e}")
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            return
+
+        self._discard_journal()
 
     def get_file_hash(self, filepath: Path) -> str:
         """Get MD5 hash of file content."""
+        import hashlib
+
         try:
             with open(filepath, "rb") as f:
                 return hashlib.md5(f.read()).hexdigest()
         except OSError:
             return ""
 
+    def _stat_key(self, filepath: Path) -> Optional[List[int]]:
+        """Get (mtime_ns, size) of a file, or None if it can't be stat'd."""
+        try:
+            stat_result = filepath.stat()
+        except OSError:
+            return None
+        # Stored as a list so it compares equal after a JSON round-trip
+        return [stat_result.st_mtime_ns, stat_result.st_size]
+
     def is_file_cached(self, filepath: Path) -> bool:
         """Check if file is cached and up-to-date."""
         if not self.enabled:
@@ -71,13 +194,20 @@ class FileCache:
             return False
 
         cached_entry = self.cache_data[file_key]
-        current_hash = self.get_file_hash(filepath)
+        current_stat = self._stat_key(filepath)
+
+        if (
+            current_stat is None
+            or cached_entry.get("stat") != current_stat
+            or "imports" not in cached_entry
+        ):
+            return False
+
+        if self.strict:
+            current_hash = self.get_file_hash(filepath)
+            return bool(current_hash) and cached_entry.get("hash") == current_hash
 
-        return (
-            current_hash
-            and cached_entry.get("hash") == current_hash
-            and "imports" in cached_entry
-        )
+        return True
 
     def get_cached_imports(self, filepath: Path) -> Set[str]:
         """Get cached imports for a file."""
@@ -91,20 +221,25 @@ class FileCache:
         return set()
 
     def cache_file_imports(self, filepath: Path, imports: Set[str]):
-        """Cache imports for a file with current hash and timestamp."""
+        """Cache imports for a file with current stat key and timestamp."""
         if not self.enabled:
             return
 
         file_key = str(filepath)
-        self.cache_data[file_key] = {
-            "hash": self.get_file_hash(filepath),
+        entry: Dict[str, Any] = {
+            "stat": self._stat_key(filepath),
             "imports": list(imports),
             "timestamp": time.time(),
         }
+        if self.strict:
+            entry["hash"] = self.get_file_hash(filepath)
+        self.cache_data[file_key] = entry
+        self._append_journal(file_key, entry)
 
     def clear_cache(self):
         """Clear all cache data."""
         self.cache_data = {}
+        self._discard_journal()
         if self.cache_file.exists():
             try:
                 self.cache_file.unlink()
@@ -6,7 +6,7 @@ all other modules to perform comprehensive dependency analysis.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .cache import FileCache
 from .gitignore import GitignoreHandler
@@ -53,10 +53,11 @@ class DependencyChecker:
 
         self.scanner = ImportScanner(
             project_root=self.project_root,
-            ignore_dirs=set(self.config["ignore_dirs"]),
+            ignore_dirs=self.config["ignore_dirs"],
             cache=self.cache,
             gitignore_handler=self.gitignore_handler,
             skip_imports=self.config.get("skip_imports", []),
+            verbose=self.verbose,
         )
 
         self.analyzer = DependencyAnalyzer(
@@ -66,24 +67,35 @@ class DependencyChecker:
 
         self.reporter = DependencyReporter(verbose=self.verbose)
 
-    def analyze_dependencies(self, use_pipreqs: bool = True) -> Dict[str, List[str]]:
-        """Perform complete dependency analysis."""
+        # Results of the most recent check(), for callers that need details
+        self.last_analysis: Dict[str, Any] = {}
+
+    def analyze_dependencies(
+        self, use_pipreqs: bool = False, files: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Perform complete dependency analysis.
+
+        ``files`` restricts the scan to the given Python files; by default the
+        whole project is scanned.
+        """
         if self.verbose:
             print("🔍 Analyzing dependencies...")
 
-        # Print verbose configuration info
-        self.reporter.print_verbose_info(
-            project_root=self.project_root,
-            requirements_file=self.config["requirements_file"],
-            has_pathspec=self.gitignore_handler.has_pathspec_support(),
-            has_rich=self.reporter.has_rich_support(),
-            cache_enabled=self.config["enable_cache"],
-            ignore_dirs=set(self.config["ignore_dirs"]),
-            pattern_count=self.gitignore_handler.get_pattern_count(),
-        )
-
-        # Find imports in code
-        imports = self.scanner.find_imports_in_code()
+            # Print verbose configuration info (only probes for rich here)
+            self.reporter.print_verbose_info(
+                project_root=self.project_root,
+                requirements_file=self.config["requirements_file"],
+                has_pathspec=self.gitignore_handler.has_pathspec_support(),
+                has_rich=self.reporter.has_rich_support(),
+                cache_enabled=self.config["enable_cache"],
+                ignore_dirs=self.config["ignore_dirs"],
+                pattern_count=self.gitignore_handler.get_pattern_count(),
+            )
+
+        # Find imports in code, journaling new cache entries so an
+        # interrupted scan resumes from where it stopped
+        with self.cache.journaling():
+            imports = self.scanner.find_imports_in_code(files)
 
         # Analyze dependencies
         results = self.analyzer.analyze_dependencies(imports, use_pipreqs)
@@ -93,11 +105,24 @@ class DependencyChecker:
 
         return results
 
-    def generate_report(self, analysis_results: Dict[str, List[str]]) -> int:
+    def generate_report(self, analysis_results: Dict[str, Any]) -> int:
         """Generate and display the dependency analysis report."""
         return self.reporter.generate_report(analysis_results)
 
-    def check(self, use_pipreqs: bool = True) -> int:
+    def check(
+        self, use_pipreqs: bool = False, files: Optional[List[str]] = None
+    ) -> int:
         """Perform complete dependency check and return exit code."""
-        results = self.analyze_dependencies(use_pipreqs)
-        return self.generate_report(results)
+        return self.check_and_analyze(use_pipreqs, files)[0]
+
+    def check_and_analyze(
+        self, use_pipreqs: bool = False, files: Optional[List[str]] = None
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Perform complete dependency check and return exit code and analysis.
+
+        Lets callers reuse the analysis (e.g. the missing packages) without
+        scanning the codebase a second time.
+        """
+        results = self.analyze_dependencies(use_pipreqs, files)
+        self.last_analysis = results
+        return self.generate_report(results), results
@@ -6,16 +6,21 @@ when available, with fallback to basic pattern matching.
 """
 
 import fnmatch
+import functools
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
-# Optional pathspec support
-try:
-    import pathspec
 
-    HAS_PATHSPEC = True
-except ImportError:
-    HAS_PATHSPEC = False
+@functools.lru_cache(maxsize=None)
+def _import_pathspec():
+    """Import the optional pathspec module on first use, or return None."""
+    try:
+        import pathspec
+
+        return pathspec
+    except ImportError:
+        return None
 
 
 class GitignoreHandler:
@@ -24,9 +29,18 @@ class GitignoreHandler:
     def __init__(self, project_root: Path, use_pathspec: bool = True):
         """Initialize gitignore handler."""
         self.project_root = project_root
-        self.use_pathspec = use_pathspec and HAS_PATHSPEC
+        self.use_pathspec = use_pathspec and _import_pathspec() is not None
         self.patterns = self._load_gitignore_patterns()
+        (
+            self.literal_names,
+            self.literal_dir_names,
+            self.pattern_list,
+        ) = self._split_literal_patterns(self.patterns)
         self.pathspec_matcher = self._create_pathspec_matcher()
+        # Globs for the fnmatch fallback, translated to regexes once
+        self.compiled_patterns = [
+            re.compile(fnmatch.translate(pattern)) for pattern in self.pattern_list
+        ]
 
     def _load_gitignore_patterns(self) -> List[str]:
         """Load patterns from .gitignore file."""
@@ -46,25 +60,84 @@ class GitignoreHandler:
 
         return patterns
 
+    @staticmethod
+    def _split_literal_patterns(
+        patterns: List[str],
+    ) -> Tuple[Set[str], Set[str], List[str]]:
+        """Split plain-name patterns from those needing glob matching.
+
+        A pattern such as ``__pycache__`` or ``.venv/`` ignores any path
+        component with that name, which a set lookup answers directly. Returns
+        ``(names, dir_names, remaining_patterns)``; ``dir_names`` only match
+        directories (trailing slash). Negated patterns can re-include paths, so
+        if any are present every pattern keeps the full matcher.
+        """
+        if any(pattern.startswith("!") for pattern in patterns):
+            return set(), set(), list(patterns)
+
+        names = set()
+        dir_names = set()
+        remaining = []
+        for pattern in patterns:
+            dir_only = pattern.endswith("/")
+            name = pattern[:-1] if dir_only else pattern
+            if not name or any(char in name for char in "*?[]/\\"):
+                remaining.append(pattern)
+            elif dir_only:
+                dir_names.add(name)
+            else:
+                names.add(name)
+
+        return names, dir_names, remaining
+
     def _create_pathspec_matcher(self):
         """Create pathspec matcher if available."""
         if not self.use_pathspec:
             return None
 
         try:
-            return pathspec.PathSpec.from_lines("gitwildmatch", self.patterns)
+            return _import_pathspec().PathSpec.from_lines(
+                "gitwildmatch", self.pattern_list
+            )
         except Exception as e:
             print(f"Warning: Could not create pathspec matcher: {e}")
             return None
 
-    def is_ignored(self, path: Path) -> bool:
-        """Check if a path should be ignored based on gitignore patterns."""
+    def is_ignored(self, path: Path, is_dir: bool = False) -> bool:
+        """Check if a path should be ignored based on gitignore patterns.
+
+        Pass ``is_dir=True`` for directories so directory-only patterns such
+        as ``build/`` apply to the path itself.
+        """
+        if self._is_ignored_by_literal_name(path, is_dir):
+            return True
+
         if self.use_pathspec and self.pathspec_matcher:
-            return self._is_ignored_by_pathspec(path)
+            return self._is_ignored_by_pathspec(path, is_dir)
         else:
-            return self._is_ignored_by_fnmatch(path)
+            return self._is_ignored_by_fnmatch(path, is_dir)
+
+    def _is_ignored_by_literal_name(self, path: Path, is_dir: bool = False) -> bool:
+        """Check path components against plain-name patterns by set lookup."""
+        if not self.literal_names and not self.literal_dir_names:
+            return False
 
-    def _is_ignored_by_pathspec(self, path: Path) -> bool:
+        try:
+            if path.is_absolute():
+                rel_path = path.relative_to(self.project_root)
+            else:
+                rel_path = path
+        except ValueError:
+            return False
+
+        parts = rel_path.parts
+        if not self.literal_names.isdisjoint(parts):
+            return True
+        # Directory-only names can't match the final component of a file
+        dir_parts = parts if is_dir else parts[:-1]
+        return not self.literal_dir_names.isdisjoint(dir_parts)
+
+    def _is_ignored_by_pathspec(self, path: Path, is_dir: bool = False) -> bool:
         """Check if path is ignored using pathspec (more accurate)."""
         if not self.pathspec_matcher:
             return False
@@ -78,12 +151,15 @@ class GitignoreHandler:
 
             # Use forward slashes for pathspec (works on all platforms)
             path_str = str(rel_path).replace("\\", "/")
+            if is_dir:
+                # A trailing slash lets directory-only patterns match
+                path_str += "/"
 
             return self.pathspec_matcher.match_file(path_str)
         except (ValueError, OSError):
             return False
 
-    def _is_ignored_by_fnmatch(self, path: Path) -> bool:
+    def _is_ignored_by_fnmatch(self, path: Path, is_dir: bool = False) -> bool:
         """Check if path is ignored using basic fnmatch patterns."""
         try:
             # Convert to relative path from project root
@@ -92,15 +168,20 @@ class GitignoreHandler:
             else:
                 rel_path = path
 
-            path_str = str(rel_path)
+            # Work on plain strings: Path.parents allocates a path per level
+            parts = str(rel_path).replace("\\", "/").split("/")
+            path_str = "/".join(parts)
+            parent_strs = ["/".join(parts[:i]) for i in range(1, len(parts))]
 
-            for pattern in self.patterns:
+            for pattern in self.compiled_patterns:
                 # Simple pattern matching - not as sophisticated as git
-                if fnmatch.fnmatch(path_str, pattern):
+                if pattern.match(path_str):
+                    return True
+                if is_dir and pattern.match(path_str + "/"):
                     return True
                 # Check if any parent directory matches
-                for parent in rel_path.parents:
-                    if fnmatch.fnmatch(str(parent), pattern):
+                for parent_str in parent_strs:
+                    if pattern.match(parent_str):
                         return True
         except (ValueError, OSError):
             pass
@@ -113,4 +194,4 @@ class GitignoreHandler:
 
     def has_pathspec_support(self) -> bool:
         """Check if pathspec is available and being used."""
-        return self.use_pathspec and HAS_PATHSPEC
+        return self.use_pathspec
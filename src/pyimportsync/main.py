@@ -2,17 +2,38 @@
 """
 Main entry point for PyImportSync when used as a module.
 """
-import argparse
 import sys
-import json
-from pathlib import Path
+from types import SimpleNamespace
+from typing import List
 
 from .checker import DependencyChecker
-from .utils import load_config, create_config_template
+from .utils import DEFAULT_IGNORE_DIRS, create_config_template
+
+
+def _default_args() -> SimpleNamespace:
+    """Argument values for a bare invocation, matching the parser defaults."""
+    return SimpleNamespace(
+        project_root=None,
+        requirements_file="requirements.txt",
+        config_file=None,
+        verbose=False,
+        quiet=False,
+        no_cache=False,
+        no_pipreqs=False,
+        respect_gitignore=True,
+        no_gitignore=False,
+        ignore_dirs="",
+        output="",
+        files=None,
+        paths=[],
+        init_config=False,
+    )
 
 
-def run():
-    """Entry point function for python -m pyimportsync."""
+def _parse_args(argv: List[str]):
+    """Parse command-line arguments with argparse."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="PyImportSync - Python Import Synchronization Tool"
     )
@@ -46,10 +67,29 @@ def run():
     parser.add_argument(
         "--output", default="", help="Output file to save missing dependencies"
     )
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        default=None,
+        help="Only scan these Python files instead of the whole project",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="Python files to scan, like --files; list them after -- when a "
+        "name could be mistaken for an option",
+    )
     parser.add_argument(
         "--init-config", action="store_true", help="Create a pyimportsync-config.json template file"
     )
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def run():
+    """Entry point function for python -m pyimportsync."""
+    argv = sys.argv[1:]
+    # A bare invocation needs no parsing; skip importing argparse for it
+    args = _parse_args(argv) if argv else _default_args()
 
     # Handle --init-config flag
     if args.init_config:
@@ -63,11 +103,7 @@ def run():
         additional_ignore_dirs = [
             d.strip() for d in args.ignore_dirs.split(",") if d.strip()
         ]
-        # Load default config to get existing ignore dirs
-        default_config = load_config(None, None)
-        merged_ignore_dirs = list(
-            set(default_config["ignore_dirs"] + additional_ignore_dirs)
-        )
+        merged_ignore_dirs = list(DEFAULT_IGNORE_DIRS.union(additional_ignore_dirs))
         config_overrides["ignore_dirs"] = merged_ignore_dirs
 
     # Handle gitignore settings
@@ -86,39 +122,28 @@ def run():
         enable_cache=not args.no_cache,
     )
 
-    # Run the check
-    result = checker.check(use_pipreqs=not args.no_pipreqs)
+    # Run the check once; its analysis also feeds the output file and quiet mode
+    files = (args.files or []) + args.paths or None
+    result = checker.check(use_pipreqs=not args.no_pipreqs, files=files)
+    missing_deps = checker.last_analysis.get("missing", ())
 
     # Handle output file if specified
     if args.output and result != 0:
         try:
-            # Get the analysis results for output
-            analysis_results = checker.analyze_dependencies(
-                use_pipreqs=not args.no_pipreqs
-            )
-            missing_deps = analysis_results.get("missing", [])
-
-            with open(args.output, "w") as f:
-                for dep in missing_deps:
-                    f.write(f"{dep}\n")
+            with open(args.output, "w", newline="\n") as f:
+                if missing_deps:
+                    f.write("\n".join(missing_deps) + "\n")
 
             if verbose:
                 print(f"Missing dependencies written to {args.output}")
-        except Exception as e:
+        except OSError as e:
             if verbose:
                 print(f"Warning: Could not write to output file {args.output}: {e}")
 
     # Handle quiet mode output for missing dependencies
     if args.quiet and result != 0:
-        try:
-            analysis_results = checker.analyze_dependencies(
-                use_pipreqs=not args.no_pipreqs
-            )
-            missing_deps = analysis_results.get("missing", [])
-            for dep in missing_deps:
-                print(dep)
-        except Exception:
-            pass  # Suppress errors in quiet mode
+        for dep in missing_deps:
+            print(dep)
 
     return result
 
@@ -5,18 +5,22 @@ This module handles report generation with optional rich formatting for
 better visual output and comprehensive dependency analysis results.
 """
 
+import functools
+import itertools
+import sys
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
-# Optional rich formatting support
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich import print as rich_print
 
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
+@functools.lru_cache(maxsize=None)
+def _import_rich_console():
+    """Import the optional rich Console class on first use, or return None."""
+    try:
+        from rich.console import Console
+
+        return Console
+    except ImportError:
+        return None
 
 
 class DependencyReporter:
@@ -25,7 +29,16 @@ class DependencyReporter:
     def __init__(self, verbose: bool = False):
         """Initialize reporter with verbosity setting."""
         self.verbose = verbose
-        self.console = Console() if HAS_RICH else None
+        self._console = None
+
+    @property
+    def console(self):
+        """Rich console, created on first use (None without rich)."""
+        if self._console is None:
+            console_class = _import_rich_console()
+            if console_class is not None:
+                self._console = console_class()
+        return self._console
 
     def print_verbose_info(
         self,
@@ -49,136 +62,137 @@ class DependencyReporter:
         print(f"🚫 Ignore directories: {', '.join(sorted(ignore_dirs))}")
         print(f"📋 Respecting .gitignore patterns ({pattern_count} patterns loaded)")
 
-    def generate_report(self, analysis_results: Dict[str, List[str]]) -> int:
+    def generate_report(self, analysis_results: Dict[str, Any]) -> int:
         """Generate and print dependency analysis report."""
         missing = analysis_results.get("missing", [])
-        matched = analysis_results.get("matched", [])
+        matched_pairs = analysis_results.get("matched_pairs", [])
         pipreqs = analysis_results.get("pipreqs", [])
         requirements_count = analysis_results.get("requirements_count", 0)
         imports_count = analysis_results.get("imports_count", 0)
         metadata_count = analysis_results.get("metadata_mappings_count", 0)
 
         if self.verbose:
-            print(
-                f"Found {len(set(missing + [m.split(' → ')[0] for m in matched]))} unique imports in code"
+            unique_imports = set(
+                itertools.chain(missing, (imp for imp, _ in matched_pairs))
             )
+            print(f"Found {len(unique_imports)} unique imports in code")
             print(f"Found {requirements_count} packages in requirements.txt")
             if pipreqs:
                 print(f"pipreqs found {len(pipreqs)} packages")
             if metadata_count:
                 print(f"Found {metadata_count} package metadata mappings")
 
-        if HAS_RICH and self.console:
+        if self.console:
             return self._generate_rich_report(
-                missing, matched, pipreqs, imports_count, requirements_count
+                missing, matched_pairs, pipreqs, imports_count, requirements_count
             )
         else:
             return self._generate_plain_report(
-                missing, matched, pipreqs, imports_count, requirements_count
+                missing, matched_pairs, pipreqs, imports_count, requirements_count
             )
 
     def _generate_rich_report(
         self,
         missing: List[str],
-        matched: List[str],
+        matched_pairs: List[Tuple[str, str]],
         pipreqs: List[str],
         imports_count: int,
         requirements_count: int,
     ) -> int:
         """Generate rich formatted report."""
-        self.console.print("\n" + "=" * 60)
-        self.console.print(
-            "🔍 [bold blue]PyImportSync DEPENDENCY ANALYSIS REPORT[/bold blue]"
-        )
-        self.console.print("=" * 60)
+        # Collect the markup and render it in a single console call
+        lines: List[str] = []
+
+        lines.append("\n" + "=" * 60)
+        lines.append("🔍 [bold blue]PyImportSync DEPENDENCY ANALYSIS REPORT[/bold blue]")
+        lines.append("=" * 60)
 
         if missing:
-            self.console.print(
-                "\n❌ [bold red]MISSING FROM REQUIREMENTS.TXT:[/bold red]"
-            )
-            self.console.print("-" * 40)
+            lines.append("\n❌ [bold red]MISSING FROM REQUIREMENTS.TXT:[/bold red]")
+            lines.append("-" * 40)
             for package in missing:
-                self.console.print(f"  • [red]{package}[/red]")
+                lines.append(f"  • [red]{package}[/red]")
         else:
-            self.console.print(
-                "\n✅ [bold green]All dependencies are satisfied![/bold green]"
-            )
+            lines.append("\n✅ [bold green]All dependencies are satisfied![/bold green]")
 
-        if matched:
-            self.console.print("\n📋 [bold green]MATCHED PACKAGES:[/bold green]")
-            self.console.print("-" * 40)
-            for match in matched:
-                self.console.print(f"  • [green]{match}[/green]")
+        if matched_pairs:
+            lines.append("\n📋 [bold green]MATCHED PACKAGES:[/bold green]")
+            lines.append("-" * 40)
+            for import_name, package_name in matched_pairs:
+                lines.append(f"  • [green]{import_name} → {package_name}[/green]")
 
         if pipreqs:
-            self.console.print(
+            lines.append(
                 f"\n📦 [bold yellow]PIPREQS DETECTED ({len(pipreqs)} packages):[/bold yellow]"
             )
-            self.console.print("-" * 40)
+            lines.append("-" * 40)
             for package in pipreqs:
-                self.console.print(f"  • [yellow]{package}[/yellow]")
+                lines.append(f"  • [yellow]{package}[/yellow]")
 
         # Summary
-        self.console.print("\n📊 [bold cyan]SUMMARY:[/bold cyan]")
-        self.console.print("-" * 40)
-        self.console.print(f"  • Code imports: [cyan]{imports_count}[/cyan]")
-        self.console.print(
-            f"  • Requirements packages: [cyan]{requirements_count}[/cyan]"
-        )
-        self.console.print(f"  • Missing packages: [cyan]{len(missing)}[/cyan]")
+        lines.append("\n📊 [bold cyan]SUMMARY:[/bold cyan]")
+        lines.append("-" * 40)
+        lines.append(f"  • Code imports: [cyan]{imports_count}[/cyan]")
+        lines.append(f"  • Requirements packages: [cyan]{requirements_count}[/cyan]")
+        lines.append(f"  • Missing packages: [cyan]{len(missing)}[/cyan]")
 
         if not missing:
-            self.console.print(
-                "\n🎉 [bold green]All dependencies are satisfied![/bold green]"
-            )
+            lines.append("\n🎉 [bold green]All dependencies are satisfied![/bold green]")
+
+        self.console.print("\n".join(lines))
 
         return 1 if missing else 0
 
     def _generate_plain_report(
         self,
         missing: List[str],
-        matched: List[str],
+        matched_pairs: List[Tuple[str, str]],
         pipreqs: List[str],
         imports_count: int,
         requirements_count: int,
     ) -> int:
         """Generate plain text report."""
-        print("\n" + "=" * 60)
-        print("🔍 PyImportSync DEPENDENCY ANALYSIS REPORT")
-        print("=" * 60)
+        # Collect the report and write it out once instead of per line
+        lines: List[str] = []
+
+        lines.append("\n" + "=" * 60)
+        lines.append("🔍 PyImportSync DEPENDENCY ANALYSIS REPORT")
+        lines.append("=" * 60)
 
         if missing:
-            print("\n❌ MISSING FROM REQUIREMENTS.TXT:")
-            print("-" * 40)
+            lines.append("\n❌ MISSING FROM REQUIREMENTS.TXT:")
+            lines.append("-" * 40)
             for package in missing:
-                print(f"  • {package}")
+                lines.append(f"  • {package}")
         else:
-            print("\n✅ All dependencies are satisfied!")
+            lines.append("\n✅ All dependencies are satisfied!")
 
-        if matched:
-            print("\n📋 MATCHED PACKAGES:")
-            print("-" * 40)
-            for match in matched:
-                print(f"  • {match}")
+        if matched_pairs:
+            lines.append("\n📋 MATCHED PACKAGES:")
+            lines.append("-" * 40)
+            for import_name, package_name in matched_pairs:
+                lines.append(f"  • {import_name} → {package_name}")
 
         if pipreqs:
-            print(f"\n📦 PIPREQS DETECTED ({len(pipreqs)} packages):")
-            print("-" * 40)
+            lines.append(f"\n📦 PIPREQS DETECTED ({len(pipreqs)} packages):")
+            lines.append("-" * 40)
             for package in pipreqs:
-                print(f"  • {package}")
+                lines.append(f"  • {package}")
 
         # Summary
-        print("\n📊 SUMMARY:")
-        print("-" * 40)
-        print(f"  • Code imports: {imports_count}")
-        print(f"  • Requirements packages: {requirements_count}")
-        print(f"  • Missing packages: {len(missing)}")
+        lines.append("\n📊 SUMMARY:")
+        lines.append("-" * 40)
+        lines.append(f"  • Code imports: {imports_count}")
+        lines.append(f"  • Requirements packages: {requirements_count}")
+        lines.append(f"  • Missing packages: {len(missing)}")
 
         if not missing:
-            print("\n🎉 All dependencies are satisfied!")
+            lines.append("\n🎉 All dependencies are satisfied!")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return 1 if missing else 0
 
     def has_rich_support(self) -> bool:
         """Check if rich formatting is available."""
-        return HAS_RICH
+        return _import_rich_console() is not None
@@ -6,13 +6,48 @@ with regex fallback for malformed files.
 """
 
 import ast
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import Set, List
+from typing import (
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    List,
+    Tuple,
+    Union,
+    cast,
+)
 
 from .cache import FileCache
 from .gitignore import GitignoreHandler
-from .utils import get_dynamic_stdlib_modules, is_local_module, should_skip_import
+from .utils import get_dynamic_stdlib_modules, scan_local_modules
+
+# Import statements for the regex fallback, matched against raw file bytes.
+# Leading whitespace is optional, so indented imports match in the same pass.
+_IMPORT_RE = re.compile(rb"^\s*(?:import|from)\s+(\w+)", re.MULTILINE)
+
+# Common built-ins that might not be in the stdlib list
+_BUILTIN_MODULE_NAMES = frozenset({"__future__", "__main__", "__builtin__", "builtins"})
+
+# Modules no project ever needs to declare, combined once at import time
+_NON_EXTERNAL_MODULES = get_dynamic_stdlib_modules() | _BUILTIN_MODULE_NAMES
+
+# AST fields holding nested statement lists (ExceptHandler and match_case
+# nodes are reached through "handlers" and "cases")
+_STATEMENT_LIST_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+# Below this many uncached files, process pool startup outweighs the parsing
+_PARALLEL_THRESHOLD = 50
+# Files per task sent to a worker; small enough to balance uneven file sizes
+_PARALLEL_CHUNKSIZE = 32
+# Files at least this large are memory-mapped rather than read in one call
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Raw source handed to the parsers: read bytes, or a read-only mapping
+_Source = Union[bytes, mmap.mmap]
 
 
 class ImportScanner:
@@ -24,130 +59,235 @@ class ImportScanner:
         ignore_dirs: Set[str],
         cache: FileCache,
         gitignore_handler: GitignoreHandler,
-        skip_imports: List[str] = None,
+        skip_imports: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        verbose: bool = False,
     ):
-        """Initialize import scanner."""
+        """Initialize import scanner.
+
+        ``max_workers`` caps the worker processes used to parse uncached files
+        (defaults to the CPU count); ``1`` keeps scanning in-process.
+        """
+        self.verbose = verbose
         self.project_root = project_root
-        self.ignore_dirs = ignore_dirs
+        self.ignore_dirs = frozenset(ignore_dirs)
         self.cache = cache
         self.gitignore_handler = gitignore_handler
         self.skip_imports = skip_imports or []
         self.stdlib_modules = get_dynamic_stdlib_modules()
-
-    def find_imports_in_code(self) -> Set[str]:
-        """Find all unique imports in the codebase."""
+        self.max_workers = max_workers
+        self._local_modules = scan_local_modules(self.project_root)
+        # Everything that is never reported as an external dependency
+        self._blocked_imports = _NON_EXTERNAL_MODULES.union(
+            self._local_modules, self.skip_imports
+        )
+
+    def find_imports_in_code(self, files: Optional[Iterable[str]] = None) -> Set[str]:
+        """Find all unique imports in the codebase.
+
+        If ``files`` is given, only those paths (relative to the project root
+        or absolute) are scanned instead of walking the whole project.
+        """
         all_imports = set()
 
-        # Walk through all Python files
-        for py_file in self.project_root.rglob("*.py"):
-            # Skip if file is in ignored directory
-            if self._should_skip_file(py_file):
-                continue
-
+        if files is None:
+            # Ignored directories are pruned during the walk itself
+            py_files = self._walk_python_files()
+        else:
+            py_files = (
+                self.project_root / f for f in files if not self._should_skip_file(f)
+            )
+
+        # Walk through all Python files, collecting those not in the cache
+        uncached_files = []
+        cached_count = 0
+        for py_file in py_files:
             # Skip if file is ignored by gitignore
             if self.gitignore_handler.is_ignored(py_file):
                 continue
 
             # Get imports from file (using cache if available)
             if self.cache.is_file_cached(py_file):
-                if self.cache.enabled:
-                    print(f"Using cached imports for {py_file}")
-                file_imports = self.cache.get_cached_imports(py_file)
+                cached_count += 1
+                all_imports.update(
+                    self._filter_external_imports(
+                        self.cache.get_cached_imports(py_file)
+                    )
+                )
             else:
-                file_imports = self._extract_imports_from_file(py_file)
-                self.cache.cache_file_imports(py_file, file_imports)
-
-            all_imports.update(file_imports)
-
-        # Filter out standard library modules and local modules
-        return self._filter_external_imports(all_imports)
-
-    def _should_skip_file(self, filepath: Path) -> bool:
-        """Check if file should be skipped based on ignore patterns."""
+                uncached_files.append(py_file)
+
+        if self.verbose and cached_count:
+            print(f"Using cached imports for {cached_count} files")
+
+        for py_file, file_imports in self._extract_imports_from_files(uncached_files):
+            # Cache the raw imports so entries stay valid if skip_imports
+            # or the project's local modules change between runs
+            self.cache.cache_file_imports(py_file, file_imports)
+            all_imports.update(self._filter_external_imports(file_imports))
+
+        # Standard library, local and skipped modules were filtered per file,
+        # so only external imports were ever collected
+        return all_imports
+
+    def _walk_python_files(self) -> Iterator[Path]:
+        """Yield Python files under the project root, pruning ignored directories.
+
+        Directories are skipped before descent if their name is in
+        ``ignore_dirs`` or they match a .gitignore pattern.
+        """
+        stack = [str(self.project_root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # DirEntry type checks reuse the readdir result
+                        if entry.is_dir(follow_symlinks=False):
+                            # Prune ignored trees once here instead of
+                            # rejecting every file inside them
+                            if entry.name in self.ignore_dirs:
+                                continue
+                            if self.gitignore_handler.is_ignored(
+                                Path(entry.path), is_dir=True
+                            ):
+                                continue
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            yield Path(entry.path)
+            except OSError as e:
+                print(f"Warning: Could not scan {directory}: {e}")
+
+    def _should_skip_file(self, filepath: Union[str, Path]) -> bool:
+        """Check if file should be skipped based on ignore patterns.
+
+        Only the part of the path below the project root is checked, so a
+        project that itself lives under e.g. a ``docs`` directory still scans.
+        """
+        path = Path(filepath)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(self.project_root.absolute())
+            except ValueError:
+                # Outside the project; check the whole path
+                pass
         # Check if any parent directory is in ignore list
-        for part in filepath.parts:
-            if part in self.ignore_dirs:
-                return True
-        return False
-
-    def _extract_imports_from_file(self, filepath: Path) -> Set[str]:
+        return not self.ignore_dirs.isdisjoint(path.parts)
+
+    def _extract_imports_from_files(
+        self, filepaths: List[Path]
+    ) -> Iterator[Tuple[Path, Set[str]]]:
+        """Extract imports from many files, using worker processes for large batches.
+
+        Results are yielded as they arrive, so callers can cache each file
+        straight away and an interrupted scan keeps what it already parsed.
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        workers = min(workers, len(filepaths))
+        done = 0
+
+        if workers > 1 and len(filepaths) >= _PARALLEL_THRESHOLD:
+            # Deferred: the process pool pulls in multiprocessing, subprocess
+            # and logging, which small and fully cached scans never need
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Workers never load the FileCache: only cache misses are sent,
+            # and their results are cached here in the parent.
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(
+                        ImportScanner._extract_imports_from_file,
+                        filepaths,
+                        chunksize=_PARALLEL_CHUNKSIZE,
+                    )
+                    for filepath, file_imports in zip(filepaths, results):
+                        yield filepath, file_imports
+                        done += 1
+            except (OSError, RuntimeError) as e:
+                # No usable multiprocessing (e.g. sandboxed); scan the rest
+                # serially
+                print(f"Warning: Parallel scanning unavailable, scanning serially: {e}")
+
+        for filepath in filepaths[done:]:
+            yield filepath, self._extract_imports_from_file(filepath)
+
+    @staticmethod
+    def _extract_imports_from_file(filepath: Path) -> Set[str]:
         """Extract import statements from a Python file using AST."""
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Try AST parsing first
-            try:
-                tree = ast.parse(content)
-                return self._extract_imports_from_ast(tree)
-            except SyntaxError:
-                # Fall back to regex parsing for malformed files
-                return self._extract_imports_regex(filepath)
-
-        except (OSError, UnicodeDecodeError) as e:
+            if os.path.getsize(filepath) < _MMAP_MIN_SIZE:
+                # Typical source files: one read is cheaper than a mapping
+                # (and covers empty files, which mmap refuses)
+                return ImportScanner._extract_imports_from_source(
+                    filepath.read_bytes(), filepath
+                )
+
+            with open(filepath, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return ImportScanner._extract_imports_from_source(content, filepath)
+
+        except OSError as e:
             print(f"Warning: Could not read {filepath}: {e}")
             return set()
 
-    def _extract_imports_from_ast(self, tree: ast.AST) -> Set[str]:
-        """Extract imports from AST tree."""
+    @staticmethod
+    def _extract_imports_from_source(content: _Source, filepath: Path) -> Set[str]:
+        """Extract imports from raw source bytes, falling back to regex."""
+        # Hand the bytes straight to compile(), skipping the ast.parse
+        # wrapper; PEP 263 encoding declarations are honoured
+        try:
+            tree = compile(
+                content,
+                str(filepath),
+                "exec",
+                flags=ast.PyCF_ONLY_AST,
+                dont_inherit=True,
+            )
+            # "exec" mode always produces an ast.Module
+            return ImportScanner._extract_imports_from_ast(cast(ast.Module, tree))
+        except (SyntaxError, ValueError):
+            # Fall back to regex parsing for malformed files
+            # (ValueError: null bytes on older Pythons)
+            return ImportScanner._extract_imports_regex(content)
+
+    @staticmethod
+    def _extract_imports_from_ast(tree: ast.Module) -> Set[str]:
+        """Extract imports from AST tree.
+
+        Import statements can only appear in statement lists, so only those
+        are walked; expressions (the bulk of most trees) are never visited.
+        """
         imports = set()
+        pending = list(tree.body)
 
-        for node in ast.walk(tree):
+        while pending:
+            node = pending.pop()
             if isinstance(node, ast.Import):
                 for alias in node.names:
-                    imports.add(alias.name.split(".")[0])
+                    imports.add(alias.name.partition(".")[0])
             elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.add(node.module.split(".")[0])
-
-        return imports
-
-    def _extract_imports_regex(self, filepath: Path) -> Set[str]:
-        """Extract imports using regex patterns as fallback."""
-        imports = set()
-
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Match various import patterns
-            patterns = [
-                r"^import\s+(\w+)",
-                r"^from\s+(\w+)",
-                r"^\s*import\s+(\w+)",
-                r"^\s*from\s+(\w+)",
-            ]
-
-            for pattern in patterns:
-                matches = re.findall(pattern, content, re.MULTILINE)
-                imports.update(matches)
-
-        except (OSError, UnicodeDecodeError):
-            pass
+                # Relative imports (level > 0) always refer to local modules
+                if node.module and not node.level:
+                    imports.add(node.module.partition(".")[0])
+            else:
+                # Descend into nested blocks: function/class bodies, if/else,
+                # try/except/finally, with, loops and match cases
+                for field in _STATEMENT_LIST_FIELDS:
+                    statements = getattr(node, field, None)
+                    if isinstance(statements, list):
+                        pending.extend(statements)
 
         return imports
 
-    def _filter_external_imports(self, all_imports: Set[str]) -> Set[str]:
-        """Filter out standard library and local modules."""
-        external_imports = set()
-
-        for imp in all_imports:
-            # Skip standard library modules
-            if imp in self.stdlib_modules:
-                continue
-
-            # Skip local modules
-            if is_local_module(imp, self.project_root):
-                continue
-
-            # Skip imports specified in configuration
-            if should_skip_import(imp, self.skip_imports):
-                continue
-
-            # Skip common built-ins that might not be in stdlib list
-            if imp in {"__future__", "__main__", "__builtin__", "builtins"}:
-                continue
+    @staticmethod
+    def _extract_imports_regex(content: _Source) -> Set[str]:
+        """Extract imports using regex patterns as fallback.
 
-            external_imports.add(imp)
+        Scans the already-loaded (or mapped) file bytes directly, without
+        re-reading or decoding the file.
+        """
+        return {match.decode("ascii") for match in _IMPORT_RE.findall(content)}
 
-        return external_imports
+    def _filter_external_imports(self, imports: Set[str]) -> Set[str]:
+        """Filter out standard library, local and skipped modules."""
+        return imports - self._blocked_imports
@@ -5,224 +5,47 @@ This module contains core utility functions including standard library detection
 configuration loading, and common helper functions.
 """
 
+import functools
+import os
 import sys
-import json
-import re
 from pathlib import Path
-from typing import Set, Dict, Optional, List
+from types import MappingProxyType
+from typing import (
+    Any,
+    Container,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
 
+# Plain Python, compiled with mypyc when built with PYIMPORTSYNC_USE_MYPYC=1
+from .utils_fast import normalize_name as _normalize_name
 
-def get_dynamic_stdlib_modules() -> Set[str]:
+
+# Standard library module names, computed once at import time
+if sys.version_info >= (3, 10):
+    # Use built-in sys.stdlib_module_names for Python 3.10+
+    _STDLIB_MODULES: FrozenSet[str] = frozenset(sys.stdlib_module_names)
+else:
+    # Fallback for older Python versions
+    from ._stdlib_legacy import STDLIB_MODULES as _STDLIB_MODULES
+
+
+def get_dynamic_stdlib_modules() -> FrozenSet[str]:
     """Get standard library modules dynamically for current Python version."""
-    if sys.version_info >= (3, 10):
-        # Use built-in sys.stdlib_module_names for Python 3.10+
-        return set(sys.stdlib_module_names)
-    else:
-        # Fallback for older Python versions
-        return {
-            "__future__",
-            "_thread",
-            "abc",
-            "aifc",
-            "argparse",
-            "array",
-            "ast",
-            "asynchat",
-            "asyncio",
-            "asyncore",
-            "atexit",
-            "audioop",
-            "base64",
-            "bdb",
-            "binascii",
-            "binhex",
-            "bisect",
-            "builtins",
-            "bz2",
-            "calendar",
-            "cgi",
-            "cgitb",
-            "chunk",
-            "cmath",
-            "cmd",
-            "code",
-            "codecs",
-            "codeop",
-            "collections",
-            "colorsys",
-            "compileall",
-            "concurrent",
-            "configparser",
-            "contextlib",
-            "copy",
-            "copyreg",
-            "cProfile",
-            "csv",
-            "ctypes",
-            "curses",
-            "datetime",
-            "dbm",
-            "decimal",
-            "difflib",
-            "dis",
-            "distutils",
-            "doctest",
-            "email",
-            "encodings",
-            "ensurepip",
-            "enum",
-            "errno",
-            "faulthandler",
-            "fcntl",
-            "filecmp",
-            "fileinput",
-            "fnmatch",
-            "formatter",
-            "fractions",
-            "ftplib",
-            "functools",
-            "gc",
-            "getopt",
-            "getpass",
-            "gettext",
-            "glob",
-            "grp",
-            "gzip",
-            "hashlib",
-            "heapq",
-            "hmac",
-            "html",
-            "http",
-            "imaplib",
-            "imghdr",
-            "imp",
-            "importlib",
-            "inspect",
-            "io",
-            "ipaddress",
-            "itertools",
-            "json",
-            "keyword",
-            "lib2to3",
-            "linecache",
-            "locale",
-            "logging",
-            "lzma",
-            "mailbox",
-            "mailcap",
-            "marshal",
-            "math",
-            "mimetypes",
-            "mmap",
-            "modulefinder",
-            "multiprocessing",
-            "netrc",
-            "nntplib",
-            "numbers",
-            "operator",
-            "optparse",
-            "os",
-            "pathlib",
-            "pdb",
-            "pickle",
-            "pickletools",
-            "pipes",
-            "pkgutil",
-            "platform",
-            "plistlib",
-            "poplib",
-            "posix",
-            "pprint",
-            "profile",
-            "pstats",
-            "pty",
-            "pwd",
-            "py_compile",
-            "pyclbr",
-            "pydoc",
-            "queue",
-            "quopri",
-            "random",
-            "re",
-            "readline",
-            "reprlib",
-            "resource",
-            "rlcompleter",
-            "runpy",
-            "sched",
-            "secrets",
-            "select",
-            "selectors",
-            "shelve",
-            "shlex",
-            "shutil",
-            "signal",
-            "site",
-            "smtpd",
-            "smtplib",
-            "sndhdr",
-            "socket",
-            "socketserver",
-            "sqlite3",
-            "ssl",
-            "stat",
-            "statistics",
-            "string",
-            "stringprep",
-            "struct",
-            "subprocess",
-            "sunau",
-            "symbol",
-            "symtable",
-            "sys",
-            "sysconfig",
-            "tabnanny",
-            "tarfile",
-            "telnetlib",
-            "tempfile",
-            "termios",
-            "textwrap",
-            "threading",
-            "time",
-            "timeit",
-            "tkinter",
-            "token",
-            "tokenize",
-            "trace",
-            "traceback",
-            "tracemalloc",
-            "tty",
-            "turtle",
-            "turtledemo",
-            "types",
-            "typing",
-            "unicodedata",
-            "unittest",
-            "urllib",
-            "uu",
-            "uuid",
-            "venv",
-            "warnings",
-            "wave",
-            "weakref",
-            "webbrowser",
-            "winreg",
-            "winsound",
-            "wsgiref",
-            "xdrlib",
-            "xml",
-            "xmlrpc",
-            "zipapp",
-            "zipfile",
-            "zipimport",
-            "zlib",
-        }
+    return _STDLIB_MODULES
 
 
-def load_config(config_file: Optional[str], config: Optional[Dict]) -> Dict:
-    """Load configuration from file or dictionary with defaults."""
-    default_config = {
-        "ignore_dirs": [
+# Default configuration, copied by load_config() on every call. Kept
+# read-only, with sequences frozen, so the shared template can't drift.
+# load_config() hands out ignore_dirs and skip_imports as frozensets.
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "ignore_dirs": (
             ".git",
             ".pytest_cache",
             ".venv",
@@ -236,38 +59,76 @@ def load_config(config_file: Optional[str], config: Optional[Dict]) -> Dict:
             "static",
             "tests",
             "venv",
-        ],
+        ),
         "requirements_file": "requirements.txt",
         "enable_cache": True,
         "cache_file": ".pyimportsync_cache.json",
         "use_pathspec": True,
         # New configuration option for skipping specific import names
-        "skip_imports": [
+        "skip_imports": frozenset(
             # Common internal module names that should be skipped
             # Users can add their own app names here
-        ],
+        ),
     }
+)
+
+# Directories skipped by default, for callers merging in extra ignore dirs
+DEFAULT_IGNORE_DIRS: FrozenSet[str] = frozenset(_DEFAULT_CONFIG["ignore_dirs"])
+
+
+@functools.lru_cache(maxsize=None)
+def _import_orjson():
+    """Import the optional orjson module on first use, or return None."""
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+def load_config(config_file: Optional[str], config: Optional[Dict]) -> Dict:
+    """Load configuration from file or dictionary with defaults."""
+    default_config = dict(_DEFAULT_CONFIG, ignore_dirs=DEFAULT_IGNORE_DIRS)
+
+    # Nothing to merge: the defaults are already in their final form
+    if not config and not config_file:
+        return default_config
 
     # If explicit config provided, merge with defaults
     if config:
         default_config.update(config)
-        return default_config
 
     # Try to load from config file
-    if config_file and Path(config_file).exists():
+    elif config_file and Path(config_file).exists():
+        import json
+
+        # Parse the raw bytes directly, with orjson when it's installed
+        # (its decode errors subclass json.JSONDecodeError)
+        orjson = _import_orjson()
+        loads = orjson.loads if orjson is not None else json.loads
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                file_config = json.load(f)
+            file_config = loads(Path(config_file).read_bytes())
             default_config.update(file_config)
         except (json.JSONDecodeError, OSError) as e:
-            print(f"Warning: Could not load config file {config_file}: {e}")
+            # Imported here to keep logging off the startup path; %-style
+            # arguments are only formatted if a handler emits the record
+            import logging
+
+            logging.getLogger(__name__).warning(
+                "Could not load config file %s: %s", config_file, e
+            )
+
+    # Every walked directory and scanned import is tested against these
+    default_config["ignore_dirs"] = frozenset(default_config["ignore_dirs"])
+    default_config["skip_imports"] = frozenset(default_config["skip_imports"])
 
     return default_config
 
 
-def get_known_import_mappings() -> Dict[str, str]:
-    """Get known mappings from import names to package names."""
-    return {
+# Known mappings from import names to package names (read-only, shared)
+_KNOWN_IMPORT_MAPPINGS: Mapping[str, str] = MappingProxyType(
+    {
         "cv2": "opencv-python",
         "PIL": "Pillow",
         "yaml": "PyYAML",
@@ -301,6 +162,28 @@ def get_known_import_mappings() -> Dict[str, str]:
         "django_cors_headers": "django-cors-headers",
         "django_filter": "django-filter",
     }
+)
+
+
+# Reverse index of the known mappings, from package names to import names
+_KNOWN_PACKAGE_MAPPINGS: Mapping[str, str] = MappingProxyType(
+    {package: import_name for import_name, package in _KNOWN_IMPORT_MAPPINGS.items()}
+)
+
+
+def get_known_import_mappings() -> Mapping[str, str]:
+    """Get known mappings from import names to package names."""
+    return _KNOWN_IMPORT_MAPPINGS
+
+
+def get_known_package_mappings() -> Mapping[str, str]:
+    """Get known mappings from package names back to import names."""
+    return _KNOWN_PACKAGE_MAPPINGS
+
+
+# Memoized since names repeat a lot; only ever called with str, so the cache
+# holds str -> str entries
+_normalize_cached = functools.lru_cache(maxsize=4096)(_normalize_name)
 
 
 def normalize_package_name(name: str) -> str:
@@ -323,57 +206,84 @@ def normalize_package_name(name: str) -> str:
     if not name or not isinstance(name, str):
         return ""
     
-    # Remove extra whitespace and convert to lowercase
-    name = name.strip().lower()
-    
-    if not name:
-        return ""
-    
-    # Step 1: Replace various separators with hyphens
-    # Handle underscores, dots, spaces
-    normalized = name.replace('_', '-').replace('.', '-').replace(' ', '-')
-    
-    # Step 2: Collapse multiple consecutive hyphens into single hyphens
-    while '--' in normalized:
-        normalized = normalized.replace('--', '-')
-    
-    # Step 3: Remove leading/trailing hyphens
-    normalized = normalized.strip('-')
-    
-    return normalized
+    return _normalize_cached(name)
+
+
+def normalize_many(names: Iterable[str]) -> List[str]:
+    """Normalize a batch of package names, e.g. every requirements entry."""
+    # Bind the function once instead of looking it up per name
+    normalize = normalize_package_name
+    return [normalize(name) for name in names]
+
+
+def scan_local_modules(project_root: Union[str, Path]) -> FrozenSet[str]:
+    """Collect top-level module names defined inside the project.
 
+    Finds ``<name>.py`` and ``<name>/__init__.py`` under the root and ``src/``,
+    and packages under ``apps/``, with one directory listing each.
+    """
+    local_modules = set()
+    root = os.fspath(project_root)
+    search_dirs = (
+        (root, True),
+        (os.path.join(root, "src"), True),
+        (os.path.join(root, "apps"), False),
+    )
+
+    for directory, include_files in search_dirs:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # DirEntry type checks reuse the readdir result; only
+                    # importable directory names cost an __init__.py stat
+                    if name.endswith(".py"):
+                        if include_files and entry.is_file():
+                            local_modules.add(name[:-3])
+                    elif name.isidentifier() and entry.is_dir():
+                        if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                            local_modules.add(name)
+        except OSError:
+            # Directory doesn't exist (e.g. no src/ layout)
+            continue
+
+    return frozenset(local_modules)
+
+
+# Per-root index for repeated is_local_module() lookups, keyed by absolute path
+_local_module_index = functools.lru_cache(maxsize=16)(scan_local_modules)
+
+
+def clear_local_module_index() -> None:
+    """Forget the indexed project layouts used by ``is_local_module``."""
+    _local_module_index.cache_clear()
 
-def is_local_module(import_name: str, project_root: Path) -> bool:
-    """Check if an import is a local module within the project."""
+
+def is_local_module(import_name: str, project_root: Union[str, Path]) -> bool:
+    """Check if an import is a local module within the project.
+
+    Each project root is listed once and then answered from a cached index;
+    call ``clear_local_module_index()`` after adding or removing modules.
+    """
     # Check for relative imports
     if import_name.startswith("."):
         return True
 
-    # Check if there's a corresponding file/directory in the project
-    potential_paths = [
-        # Standard Python module patterns
-        project_root / f"{import_name}.py",
-        project_root / import_name / "__init__.py",
-        
-        # Source directory patterns (common in many projects)
-        project_root / "src" / f"{import_name}.py",
-        project_root / "src" / import_name / "__init__.py",
-        
-        # Common app directory patterns
-        project_root / "apps" / import_name / "__init__.py",
-    ]
-
-    # Direct path check - if the module exists as a directory/file, it's local
-    return any(path.exists() for path in potential_paths)
+    # Check the project's module index rather than stat-ing every candidate
+    # path for each import. Keying it by the absolute path keeps relative
+    # roots correct across chdir() and lets str and Path roots share an entry.
+    return import_name in _local_module_index(os.path.abspath(project_root))
 
 
-def should_skip_import(import_name: str, skip_imports: List[str]) -> bool:
+def should_skip_import(import_name: str, skip_imports: Container[str]) -> bool:
     """Check if an import should be skipped based on configuration."""
     return import_name in skip_imports
 
 
 def create_config_template() -> int:
     """Create a pyimportsync-config.json template file."""
+    import json
+
     config_template = {
         "_comment": "PyImportSync configuration file",
         "_documentation": "https://github.com/trivedi-vatsal/PyImportSync/blob/main/docs/configuration.md",
@@ -419,8 +329,9 @@ def create_config_template() -> int:
             return 0
     
     try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config_template, f, indent=2, ensure_ascii=False)
+        # Encode once and write in one call; json.dump() writes piecemeal
+        content = json.dumps(config_template, indent=2, ensure_ascii=False)
+        config_file.write_bytes(content.encode('utf-8'))
         
         print(f"✅ Configuration template created: {config_file}")
         print("📝 Edit the file to customize settings for your project.")
@@ -0,0 +1,57 @@
+"""
+Hot string helpers for PyImportSync, kept compilable with mypyc.
+
+This module is plain, fully annotated Python with no dependencies on the rest
+of the package. Built with ``PYIMPORTSYNC_USE_MYPYC=1`` it is compiled to a C
+extension; otherwise it is imported as ordinary Python with the same behavior.
+"""
+
+from typing import Dict, Optional, Pattern
+
+# Maps every recognized name separator to a hyphen and ASCII letters to
+# lowercase, so one translate() pass does both
+_NORMALIZE_TABLE: Dict[int, int] = str.maketrans(
+    "_. ABCDEFGHIJKLMNOPQRSTUVWXYZ", "---abcdefghijklmnopqrstuvwxyz"
+)
+
+# Compiled on first use, keeping ``re`` off import
+_hyphen_run_re: Optional[Pattern[str]] = None
+
+
+def _collapse_hyphens(name: str) -> str:
+    """Collapse runs of two or more hyphens into a single hyphen."""
+    global _hyphen_run_re
+    if _hyphen_run_re is None:
+        import re
+
+        _hyphen_run_re = re.compile(r"-{2,}")
+    return _hyphen_run_re.sub("-", name)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a package name string (see ``utils.normalize_package_name``)."""
+    # Remove extra whitespace
+    name = name.strip()
+
+    if not name:
+        return ""
+
+    # Fast path for the most common shape: already lowercase, no separators
+    if name.isalnum() and name.islower():
+        return name
+
+    # The table only lowercases ASCII; other names need full Unicode lowering
+    if not name.isascii():
+        name = name.lower()
+
+    # Step 1: Lowercase and replace separators (underscores, dots, spaces)
+    # with hyphens in a single pass
+    normalized = name.translate(_NORMALIZE_TABLE)
+
+    # Step 2: Collapse runs of hyphens into single hyphens in one pass; most
+    # names have none, and single hyphens are never rewritten
+    if "--" in normalized:
+        normalized = _collapse_hyphens(normalized)
+
+    # Step 3: Remove leading/trailing hyphens
+    return normalized.strip("-")
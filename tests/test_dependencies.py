@@ -27,7 +27,7 @@ class TestDependencyChecker(unittest.TestCase):
         """Test DependencyChecker initialization."""
         checker = DependencyChecker(self.temp_dir)
         self.assertEqual(checker.project_root, self.project_path)
-        self.assertTrue(isinstance(checker.config["ignore_dirs"], list))
+        self.assertTrue(isinstance(checker.config["ignore_dirs"], frozenset))
 
     def test_gitignore_loading(self):
         """Test .gitignore pattern loading."""
@@ -51,6 +51,66 @@ env/
         self.assertIn("*.pyc", patterns)
         self.assertIn("venv/", patterns)
 
+    def test_gitignore_literal_and_dir_patterns(self):
+        """Test plain-name and directory-only patterns on both backends."""
+        from pyimportsync.gitignore import GitignoreHandler
+
+        (self.project_path / ".gitignore").write_text(
+            "__pycache__\nbuild/\n*.log\nout/*.py\n"
+        )
+
+        for use_pathspec in (True, False):
+            with self.subTest(use_pathspec=use_pathspec):
+                handler = GitignoreHandler(self.project_path, use_pathspec)
+                self.assertEqual(handler.has_pathspec_support(), use_pathspec)
+                self.assertEqual(handler.literal_names, {"__pycache__"})
+                self.assertEqual(handler.literal_dir_names, {"build"})
+                self.assertEqual(handler.pattern_list, ["*.log", "out/*.py"])
+
+                # Literal names match at any depth, files or directories
+                self.assertTrue(handler.is_ignored(Path("pkg/__pycache__/m.py")))
+                self.assertTrue(
+                    handler.is_ignored(self.project_path / "__pycache__", True)
+                )
+                # Directory-only patterns skip files of the same name
+                self.assertTrue(handler.is_ignored(Path("build"), is_dir=True))
+                self.assertTrue(handler.is_ignored(Path("pkg/build/m.py")))
+                self.assertFalse(handler.is_ignored(Path("pkg/build")))
+                # Everything else goes to the glob matcher
+                self.assertTrue(handler.is_ignored(Path("debug.log")))
+                self.assertTrue(handler.is_ignored(Path("out/gen.py")))
+                self.assertFalse(handler.is_ignored(Path("pkg/main.py")))
+
+    def test_gitignore_negation_disables_literal_split(self):
+        """Test a negated pattern keeps every pattern on the full matcher."""
+        from pyimportsync.gitignore import GitignoreHandler
+
+        (self.project_path / ".gitignore").write_text("cache\n!src/cache\n")
+
+        handler = GitignoreHandler(self.project_path, use_pathspec=True)
+        self.assertEqual(handler.literal_names, set())
+        self.assertEqual(handler.literal_dir_names, set())
+        self.assertEqual(handler.pattern_list, ["cache", "!src/cache"])
+
+        self.assertTrue(handler.is_ignored(Path("cache/m.py")))
+        self.assertFalse(handler.is_ignored(Path("src/cache/m.py")))
+
+    def test_gitignore_prunes_directories(self):
+        """Test ignored directories are pruned from the project walk."""
+        (self.project_path / ".gitignore").write_text("generated\nbuild/\n")
+        for directory in ("pkg/generated", "build", "pkg/build"):
+            (self.project_path / directory).mkdir(parents=True, exist_ok=True)
+        (self.project_path / "main.py").write_text("import requests\n")
+        (self.project_path / "pkg" / "generated" / "m.py").write_text("import yaml\n")
+        (self.project_path / "build" / "m.py").write_text("import numpy\n")
+        (self.project_path / "pkg" / "build" / "m.py").write_text("import toml\n")
+        (self.project_path / "pkg" / "app.py").write_text("import flask\n")
+
+        checker = DependencyChecker(self.temp_dir, enable_cache=False)
+        imports = checker.scanner.find_imports_in_code()
+
+        self.assertEqual(imports, {"requests", "flask"})
+
     def test_python_file_detection(self):
         """Test Python file detection through imports scanning."""
         # Create some test files
@@ -68,6 +128,182 @@ env/
         self.assertNotIn("os", imports)
         self.assertNotIn("json", imports)
 
+    def test_nested_and_relative_imports(self):
+        """Test imports inside blocks are found and relative imports skipped."""
+        (self.project_path / "main.py").write_text(
+            "try:\n"
+            "    import yaml\n"
+            "except ImportError:\n"
+            "    yaml = None\n"
+            "def load():\n"
+            "    from numpy.linalg import norm\n"
+            "from .helpers import tool\n"
+        )
+
+        checker = DependencyChecker(self.temp_dir, enable_cache=False)
+        imports = checker.scanner.find_imports_in_code()
+
+        self.assertEqual(imports, {"yaml", "numpy"})
+
+    def test_scan_explicit_files(self):
+        """Test scanning only given files, checking ignore dirs below the root."""
+        # The project itself lives under a directory named like an ignore dir
+        project = self.project_path / "docs" / "proj"
+        (project / "tests").mkdir(parents=True)
+        (project / "main.py").write_text("import requests\n")
+        (project / "other.py").write_text("import flask\n")
+        (project / "tests" / "test_main.py").write_text("import pytest\n")
+
+        checker = DependencyChecker(str(project), enable_cache=False)
+        imports = checker.scanner.find_imports_in_code(
+            files=["main.py", str(project / "other.py"), "tests/test_main.py"]
+        )
+
+        self.assertEqual(imports, {"requests", "flask"})
+
+    def test_local_module_index_follows_cwd(self):
+        """Test a relative project root is indexed by its absolute path."""
+        from pyimportsync.utils import clear_local_module_index, is_local_module
+
+        (self.project_path / "one").mkdir()
+        (self.project_path / "two").mkdir()
+        (self.project_path / "one" / "alpha.py").write_text("")
+        (self.project_path / "two" / "beta.py").write_text("")
+
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.project_path / "one")
+            self.assertTrue(is_local_module("alpha", "."))
+            os.chdir(self.project_path / "two")
+            self.assertFalse(is_local_module("alpha", "."))
+            self.assertTrue(is_local_module("beta", "."))
+
+            # New modules are seen once the index is cleared
+            (self.project_path / "two" / "gamma.py").write_text("")
+            self.assertFalse(is_local_module("gamma", "."))
+            clear_local_module_index()
+            self.assertTrue(is_local_module("gamma", "."))
+        finally:
+            os.chdir(cwd)
+
+    def _write_many_modules(self):
+        """Write enough files to take the parallel scanning path."""
+        from pyimportsync.scanner import _PARALLEL_THRESHOLD
+
+        count = _PARALLEL_THRESHOLD + 10
+        for i in range(count):
+            (self.project_path / f"module_{i}.py").write_text(f"import pkg{i}\n")
+        return {f"pkg{i}" for i in range(count)}
+
+    def test_parallel_scan(self):
+        """Test a large scan through worker processes caches every file."""
+        expected = self._write_many_modules()
+
+        checker = DependencyChecker(self.temp_dir)
+        checker.scanner.max_workers = 2
+        imports = checker.scanner.find_imports_in_code()
+
+        self.assertEqual(imports, expected)
+        for i in range(len(expected)):
+            source = self.project_path / f"module_{i}.py"
+            self.assertEqual(checker.cache.get_cached_imports(source), {f"pkg{i}"})
+
+    def test_parallel_scan_serial_fallback(self):
+        """Test the scan falls back to serial when no pool can be started."""
+        from unittest import mock
+
+        expected = self._write_many_modules()
+
+        checker = DependencyChecker(self.temp_dir, enable_cache=False)
+        checker.scanner.max_workers = 2
+        with mock.patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            side_effect=OSError("no semaphores"),
+        ) as pool:
+            imports = checker.scanner.find_imports_in_code()
+
+        pool.assert_called_once()
+        self.assertEqual(imports, expected)
+
+    def test_malformed_file_regex_fallback(self):
+        """Test imports are still found in files that fail to parse."""
+        (self.project_path / "legacy.py").write_text(
+            'print "python 2"\nimport requests\nfrom flask import Flask\n'
+        )
+
+        checker = DependencyChecker(self.temp_dir, enable_cache=False)
+        imports = checker.scanner.find_imports_in_code()
+
+        self.assertEqual(imports, {"requests", "flask"})
+
+    def test_cache_invalidation(self):
+        """Test cached imports are invalidated when a file changes."""
+        from pyimportsync.cache import FileCache
+
+        source = self.project_path / "main.py"
+        source.write_text("import requests\n")
+        cache = FileCache(cache_file=str(self.project_path / "cache.json"))
+
+        cache.cache_file_imports(source, {"requests"})
+        self.assertTrue(cache.is_file_cached(source))
+
+        source.write_text("import requests\nimport flask\n")
+        self.assertFalse(cache.is_file_cached(source))
+
+    def test_cache_journal_replay(self):
+        """Test journaled entries survive an unsaved run, torn lines skipped."""
+        from pyimportsync.cache import FileCache
+
+        first = self.project_path / "first.py"
+        second = self.project_path / "second.py"
+        first.write_text("import requests\n")
+        second.write_text("import flask\n")
+        cache_file = str(self.project_path / "cache.json")
+
+        # Outside journaling() nothing is written for non-saving callers
+        cache = FileCache(cache_file=cache_file)
+        cache.cache_file_imports(first, {"requests"})
+        self.assertFalse(cache.journal_file.exists())
+
+        # An interrupted run leaves its journal behind, last line torn
+        with self.assertRaises(KeyboardInterrupt):
+            with cache.journaling():
+                cache.cache_file_imports(first, {"requests"})
+                cache.cache_file_imports(second, {"flask"})
+                raise KeyboardInterrupt
+        with open(cache.journal_file, "ab") as f:
+            f.write(b'{"third.py": {"imp')
+
+        resumed = FileCache(cache_file=cache_file)
+        self.assertTrue(resumed.is_file_cached(first))
+        self.assertEqual(resumed.get_cached_imports(second), {"flask"})
+        self.assertNotIn("third.py", resumed.cache_data)
+
+        # Saving folds the journal into the cache file
+        resumed.save_cache()
+        self.assertFalse(resumed.journal_file.exists())
+        self.assertTrue(FileCache(cache_file=cache_file).is_file_cached(second))
+
+    def test_normalize_package_name(self):
+        """Test package name normalization."""
+        from pyimportsync.utils import normalize_many, normalize_package_name
+
+        self.assertEqual(normalize_package_name("Foo_Bar"), "foo-bar")
+        self.assertEqual(normalize_package_name("zope.interface"), "zope-interface")
+        self.assertEqual(normalize_package_name("  --a__b..c--  "), "a-b-c")
+        self.assertEqual(normalize_package_name("requests"), "requests")
+        self.assertEqual(normalize_package_name(""), "")
+        self.assertEqual(normalize_package_name(None), "")
+        self.assertEqual(
+            normalize_many(["Foo_Bar", "requests"]), ["foo-bar", "requests"]
+        )
+
+    def test_default_args_match_parser(self):
+        """Test the bare-invocation defaults agree with the argument parser."""
+        from pyimportsync.main import _default_args, _parse_args
+
+        self.assertEqual(vars(_default_args()), vars(_parse_args([])))
+
     def tearDown(self):
         """Clean up test fixtures."""
         import shutil